@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
+import asyncio
 import sys
-import os
 sys.path.insert(0, 'src')
 
 from mcp_logic.server import LogicEngine
@@ -9,12 +9,11 @@ def test_prove_directly():
     # Initialize the logic engine
     engine = LogicEngine("/Volumes/External/Code/mcp-logic/ladr/bin")
 
-    # Create input file for the syllogism
+    # Build the input for the syllogism
     premises = ["all x (man(x) -> mortal(x))", "man(socrates)"]
     conclusion = "mortal(socrates)"
 
-    # Create the input file
-    input_file = engine._create_input_file(premises, conclusion)
+    input_text = engine._build_input(premises, conclusion)
 
     print("Testing the famous syllogism:")
     print("Premises:")
@@ -24,7 +23,7 @@ def test_prove_directly():
     print()
 
     # Run the proof
-    result = engine._run_prover(input_file)
+    result = asyncio.run(engine._run_prover(input_text))
 
     print("Result:")
     print(f"Status: {result['result']}")
@@ -1,15 +1,7 @@
-import asyncio
-import argparse
-from pathlib import Path
-from .server import main
+from .server import cli
 
 def run():
-    parser = argparse.ArgumentParser(description='MCP Logic Server')
-    parser.add_argument('--prover-path', type=str, required=True,
-                      help='Path to Prover9/Mace4 binaries')
-    
-    args = parser.parse_args()
-    asyncio.run(main(args.prover_path))
+    cli()
 
 if __name__ == '__main__':
-    run()
\ No newline at end of file
+    run()
@@ -15,10 +15,79 @@
 File parser for Prover9/Mace4 .in files
 """
 
-import re
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+def _scan(content: str) -> Tuple[Tuple[str, ...], Optional[str]]:
+    """Single-pass scanner over Prover9 file content.
+
+    Walks the content once, treating every dot as a token terminator and
+    dispatching on each token: section headers and end_of_list switch the
+    current section (wherever they appear on a line), and everything else
+    inside a section is a formula. Replaces the comment-strip pass plus
+    per-section regex searches.
+    """
+    premises = []
+    conclusion = None
+    section = None  # None | 'assumptions' | 'goals'
+    buf = []  # Pieces of a formula continued across lines
+
+    for line in content.split('\n'):
+        line = line.strip()
+        if not line or line.startswith('%'):
+            continue
+
+        # Every piece before a dot completes a token; the piece after the
+        # last dot (if any) continues on the next line
+        pieces = line.split('.')
+        for piece in pieces[:-1]:
+            if buf:
+                token = ' '.join((*buf, piece)).strip()
+                buf = []
+            else:
+                token = piece.strip()
+
+            lowered = token.lower()
+            if lowered == 'formulas(assumptions)':
+                section = 'assumptions'
+            elif lowered == 'formulas(goals)':
+                section = 'goals'
+            elif lowered == 'end_of_list':
+                section = None
+            elif token and section == 'assumptions':
+                premises.append(token)
+            elif token and section == 'goals' and conclusion is None:
+                conclusion = token  # Take the first goal as the conclusion
+
+        tail = pieces[-1].strip()
+        if tail:
+            buf.append(tail)
+
+    return tuple(premises), conclusion
+
+
+@lru_cache(maxsize=256)
+def _parse_content_cached(content: str) -> Tuple[Tuple[str, ...], Optional[str]]:
+    """Parse Prover9 file content, memoized on the content string.
+
+    Returns immutable tuples so cached results can be shared safely.
+    """
+    return _scan(content)
+
+
+@lru_cache(maxsize=256)
+def _parse_file_cached(path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, ...], Optional[str]]:
+    """Read and parse a .in file, memoized on (path, mtime, size).
+
+    The mtime/size key means an unchanged file skips both the file I/O and
+    the regex work on repeated calls; a modified file naturally misses.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return _parse_content_cached(content)
+
 
 class Prover9FileParser:
     """Parser for Prover9/Mace4 input files"""
@@ -40,10 +109,9 @@ class Prover9FileParser:
         if not path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        return self.parse_content(content)
+        st = os.stat(path)
+        premises, conclusion = _parse_file_cached(str(path.resolve()), st.st_mtime_ns, st.st_size)
+        return list(premises), conclusion
 
     def parse_content(self, content: str) -> Tuple[List[str], Optional[str]]:
         """
@@ -55,41 +123,8 @@ class Prover9FileParser:
         Returns:
             Tuple of (premises_list, conclusion_string_or_none)
         """
-        # Remove comments (lines starting with %)
-        lines = []
-        for line in content.split('\n'):
-            line = line.strip()
-            if line and not line.startswith('%'):
-                lines.append(line)
-
-        content = '\n'.join(lines)
-
-        # Extract assumptions (premises)
-        premises = []
-        assumptions_match = re.search(r'formulas\(assumptions\)\.\s*(.*?)\s*end_of_list\.', content, re.DOTALL | re.IGNORECASE)
-        if assumptions_match:
-            assumptions_block = assumptions_match.group(1).strip()
-            # Split by dots and clean up
-            formulas = re.split(r'\.\s*', assumptions_block)
-            for formula in formulas:
-                formula = formula.strip()
-                if formula and not formula.lower().startswith('end'):
-                    premises.append(formula)
-
-        # Extract goals (conclusion)
-        conclusion = None
-        goals_match = re.search(r'formulas\(goals\)\.\s*(.*?)\s*end_of_list\.', content, re.DOTALL | re.IGNORECASE)
-        if goals_match:
-            goals_block = goals_match.group(1).strip()
-            # Split by dots and clean up
-            goals = re.split(r'\.\s*', goals_block)
-            for goal in goals:
-                goal = goal.strip()
-                if goal and not goal.lower().startswith('end'):
-                    conclusion = goal
-                    break  # Take the first goal as the conclusion
-
-        return premises, conclusion
+        premises, conclusion = _parse_content_cached(content)
+        return list(premises), conclusion
 
     def parse_mace4_file(self, file_path: str) -> List[str]:
         """
@@ -106,6 +141,11 @@ class Prover9FileParser:
         return premises
 
 
+# Shared parser instance: the class is stateless, so the convenience
+# functions reuse one object instead of allocating per call
+_PARSER = Prover9FileParser()
+
+
 def parse_prover9_file(file_path: str) -> Tuple[List[str], Optional[str]]:
     """
     Convenience function to parse a Prover9 file.
@@ -116,8 +156,7 @@ def parse_prover9_file(file_path: str) -> Tuple[List[str], Optional[str]]:
     Returns:
         Tuple of (premises, conclusion)
     """
-    parser = Prover9FileParser()
-    return parser.parse_file(file_path)
+    return _PARSER.parse_file(file_path)
 
 
 def parse_mace4_file(file_path: str) -> List[str]:
@@ -130,5 +169,4 @@ def parse_mace4_file(file_path: str) -> List[str]:
     Returns:
         List of premises
     """
-    parser = Prover9FileParser()
-    return parser.parse_mace4_file(file_path)
+    return _PARSER.parse_mace4_file(file_path)
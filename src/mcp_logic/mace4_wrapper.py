@@ -34,7 +34,24 @@ class Mace4Wrapper:
             if not self.mace4_exe.exists():
                 raise FileNotFoundError(f"Mace4 not found at {self.mace4_exe} or with .exe extension")
 
-        logger.debug(f"Initialized Mace4 wrapper with Mace4 at {self.mace4_exe}")
+        logger.debug("Initialized Mace4 wrapper with Mace4 at %s", self.mace4_exe)
+
+        # Temp input files awaiting deletion; swept off the hot path at the
+        # start of the next run instead of synchronously after each result
+        self._pending_unlinks: List[Path] = []
+
+    def _sweep_pending_unlinks(self):
+        """Best-effort deletion of temp files left over from earlier runs"""
+        remaining = []
+        for path in self._pending_unlinks:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass  # Already gone
+            except OSError as e:
+                logger.debug("Deferred cleanup of %s failed, will retry: %s", path, e)
+                remaining.append(path)
+        self._pending_unlinks = remaining
 
     def _create_input_file(self, premises: List[str], goal: Optional[str] = None, domain_size: Optional[int] = None) -> Path:
         """Create a Mace4 input file
@@ -76,7 +93,7 @@ class Mace4Wrapper:
             content.append("end_of_list.")
 
         input_content = "\n".join(content)
-        logger.debug(f"Created Mace4 input file content:\n{input_content}")
+        logger.debug("Created Mace4 input file content:\n%s", input_content)
 
         fd, path = tempfile.mkstemp(suffix=".in", text=True)
         with os.fdopen(fd, "w") as f:
@@ -93,16 +110,17 @@ class Mace4Wrapper:
         Returns:
             Dictionary with result, model details, and output
         """
+        self._sweep_pending_unlinks()
         try:
-            logger.debug(f"Running Mace4 with input file: {input_path}")
+            logger.debug("Running Mace4 with input file: %s", input_path)
 
             # Set working directory to Mace4 directory
             cwd = str(self.mace4_exe.parent)
             result = subprocess.run([str(self.mace4_exe), "-f", str(input_path)], capture_output=True, text=True, timeout=timeout, cwd=cwd)
 
-            logger.debug(f"Mace4 stdout:\n{result.stdout}")
+            logger.debug("Mace4 stdout:\n%s", result.stdout)
             if result.stderr:
-                logger.debug(f"Mace4 stderr:\n{result.stderr}")
+                logger.debug("Mace4 stderr:\n%s", result.stderr)
 
             # Parse Mace4 output
             if "DOMAIN SIZE" in result.stdout and "interpretation(" in result.stdout:
@@ -117,16 +135,15 @@ class Mace4Wrapper:
                 return {"result": "unknown", "reason": "Unexpected Mace4 output", "output": result.stdout, "error": result.stderr}
 
         except subprocess.TimeoutExpired:
-            logger.error(f"Mace4 search timed out after {timeout} seconds")
+            logger.error("Mace4 search timed out after %s seconds", timeout)
             return {"result": "timeout", "reason": f"Model search exceeded {timeout} seconds"}
         except Exception as e:
-            logger.error(f"Mace4 error: {e}")
+            logger.error("Mace4 error: %s", e)
             return {"result": "error", "reason": str(e)}
         finally:
-            try:
-                input_path.unlink()  # Clean up temp file
-            except (FileNotFoundError, PermissionError, OSError):
-                pass  # Temp file cleanup failed, not critical
+            # Defer temp-file deletion to the next run's sweep so the
+            # response path carries no cleanup syscall
+            self._pending_unlinks.append(input_path)
 
     def _parse_model(self, output: str) -> Dict[str, Any]:
         """Parse Mace4 model output into structured format
@@ -139,14 +156,14 @@ class Mace4Wrapper:
         """
         model = {"domain_size": None, "predicates": {}, "functions": {}, "constants": {}, "raw_interpretation": ""}
 
-        # Extract domain size
-        for line in output.split("\n"):
-            if "DOMAIN SIZE" in line:
-                try:
-                    size = int(line.split()[-1])
-                    model["domain_size"] = size
-                except (ValueError, IndexError):
-                    pass  # Failed to parse domain size, not critical
+        # Extract domain size: partition stops at the first marker instead
+        # of materializing every output line
+        _, sep, tail = output.partition("DOMAIN SIZE")
+        if sep:
+            try:
+                model["domain_size"] = int(tail.partition("\n")[0].split()[0])
+            except (ValueError, IndexError):
+                pass  # Failed to parse domain size, not critical
 
         # Extract interpretation block
         if "interpretation(" in output:
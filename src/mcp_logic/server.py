@@ -11,13 +11,17 @@
 # Licensed under the MIT License.
 # Commercial licensing available upon request.
 
+import hashlib
 import logging
-import os
-import subprocess
+import re
+import shutil
 import tempfile
+import uuid
 import argparse
 import asyncio
 import json
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, List, Dict, Tuple, Optional
 from pathlib import Path
 from mcp.server.models import InitializationOptions
@@ -26,134 +30,422 @@ from mcp.server import NotificationOptions, Server
 import mcp.server.stdio
 
 # Import new modules
-from mcp_logic.mace4_wrapper import Mace4Wrapper
 from mcp_logic.syntax_validator import validate_formulas
-from mcp_logic.categorical_helpers import CategoricalHelpers
-from mcp_logic.file_parser import parse_prover9_file, parse_mace4_file
+from mcp_logic.categorical_helpers import CategoricalHelpers, monoid_axioms, group_axioms
+from mcp_logic.file_parser import parse_prover9_file
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
+# Logging level is configured in cli(); default to INFO so multi-KB prover
+# outputs are not formatted on every call
 logger = logging.getLogger("mcp_logic")
 
+# CategoricalHelpers is stateless; share one instance across tool calls
+_HELPERS = CategoricalHelpers()
+
+# The fixed axiom lists never change, so build them once at import; the
+# name-parameterized ones are memoized below. Treat these as read-only.
+_CATEGORY_AXIOMS = _HELPERS.category_axioms()
+_MONOID_AXIOMS = monoid_axioms()
+_GROUP_AXIOMS = group_axioms()
+
+
+@lru_cache(maxsize=64)
+def _functor_axioms(functor_name: str) -> Tuple[str, ...]:
+    return tuple(_HELPERS.functor_axioms(functor_name))
+
+
+@lru_cache(maxsize=64)
+def _natural_transformation_condition(functor_f: str, functor_g: str, component: str) -> Tuple[str, ...]:
+    return tuple(_HELPERS.natural_transformation_condition(functor_f, functor_g, component))
+
+
+# Prefer orjson (C/SIMD encoder) for serializing tool responses; large
+# proof and model payloads encode several times faster than stdlib json
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
+@lru_cache(maxsize=256)
+def _validate_file(path: str, mtime_ns: int, size: int) -> str:
+    """Parse and validate a .in file, memoized on (path, mtime, size).
+
+    Caches the serialized response string, so an unchanged file costs one
+    stat() plus a dict lookup — no parse, validation, or re-serialization.
+    """
+    premises, conclusion = parse_prover9_file(path)
+    statements = premises + ([conclusion] if conclusion else [])
+    return _dumps(validate_formulas(statements))
+
+
+@lru_cache(maxsize=8)
+def _resolve_prover(prover_path: str) -> Path:
+    """Resolve the Prover9 executable inside prover_path, cached per path.
+
+    Tries the Windows .exe name first (matching the historical probe
+    order), then shutil.which restricted to the directory, which also
+    covers executable-bit checks.
+    """
+    base = Path(prover_path)
+    exe = base / "prover9.exe"
+    if exe.exists():
+        return exe
+    found = shutil.which("prover9", path=str(base))
+    if found:
+        return Path(found)
+    # Final fallback keeps the historical behavior of accepting a plain
+    # file even if which() rejects it (e.g. odd permission bits)
+    exe = base / "prover9"
+    if exe.exists():
+        return exe
+    raise FileNotFoundError(f"Prover9 not found at {exe} or with .exe extension")
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "mcp-logic"
+
+# Keep at most this many proof results in memory; the on-disk store is unbounded.
+PROOF_CACHE_MAX_ENTRIES = 1024
+
+# Separator used when hashing normalized formulas into a cache key
+_CACHE_KEY_SEP = "\x1e"
+
+# Default cap on concurrent Prover9 subprocesses. Prover9 is one-shot (one
+# problem per process), so overhead is bounded by limiting how many
+# fork+exec'd provers run at once rather than by reusing processes.
+DEFAULT_PROVER_WORKERS = 4
+
 
 class LogicEngine:
-    def __init__(self, prover_path: str):
-        """Initialize connection to Prover9 and Mace4"""
+    def __init__(self, prover_path: str, cache_dir: Optional[Path] = DEFAULT_CACHE_DIR, max_workers: int = DEFAULT_PROVER_WORKERS):
+        """Initialize connection to Prover9 and Mace4
+
+        Args:
+            prover_path: Path to directory containing Prover9/Mace4 binaries
+            cache_dir: Directory for the on-disk proof cache, or None to
+                disable caching entirely
+            max_workers: Maximum number of Prover9 subprocesses allowed to
+                run concurrently
+        """
         self.prover_path = Path(prover_path)
+        self.max_workers = max(1, max_workers)
+        self._worker_slots = asyncio.Semaphore(self.max_workers)
 
-        # Initialize Prover9
-        self.prover_exe = self.prover_path / "prover9.exe"
-        if not self.prover_exe.exists():
-            self.prover_exe = self.prover_path / "prover9"
-            if not self.prover_exe.exists():
-                raise FileNotFoundError(f"Prover9 not found at {self.prover_exe} or with .exe extension")
+        # Initialize Prover9 (resolution cached per prover_path)
+        self.prover_exe = _resolve_prover(str(self.prover_path))
 
-        logger.debug(f"Initialized Logic Engine with Prover9 at {self.prover_exe}")
+        logger.debug("Initialized Logic Engine with Prover9 at %s", self.prover_exe)
+
+        # Initialize Mace4 (imported lazily so `cli --help` stays fast)
+        from mcp_logic.mace4_wrapper import Mace4Wrapper
 
-        # Initialize Mace4
         try:
             self.mace4 = Mace4Wrapper(self.prover_path)
             logger.debug("Mace4 wrapper initialized successfully")
         except FileNotFoundError as e:
-            logger.warning(f"Mace4 not available: {e}")
+            logger.warning("Mace4 not available: %s", e)
             self.mace4 = None
 
-    def _create_input_file(self, premises: List[str], goal: str) -> Path:
-        """Create a Prover9 input file"""
-        content = ["formulas(assumptions).", *[p if p.endswith(".") else p + "." for p in premises], "end_of_list.", "", "formulas(goals).", goal if goal.endswith(".") else goal + ".", "end_of_list."]
+        # Content-addressed proof cache: repeated proofs of the same
+        # premises/conclusion skip the Prover9 subprocess entirely.
+        # cache_dir=None disables both the on-disk store and the in-memory
+        # LRU; an unusable directory degrades to memory-only caching.
+        self.cache_enabled = cache_dir is not None
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._proof_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        if self.cache_dir is not None:
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.warning("Proof cache directory unavailable, caching in memory only: %s", e)
+                self.cache_dir = None
+
+        # Full prover outputs are stored here and referenced by path in
+        # responses instead of being inlined (see get-prover-output)
+        self.output_dir = (self.cache_dir or Path(tempfile.gettempdir()) / "mcp-logic") / "outputs"
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning("Prover output directory unavailable, outputs kept inline: %s", e)
+            self.output_dir = None
+
+    def _cache_key(self, premises: List[str], conclusion: str, extra: str = "", exe: Optional[Path] = None) -> str:
+        """Build a content hash for a proof problem.
+
+        Premises are whitespace-normalized and sorted so logically identical
+        inputs hash the same; the identity of the binary that will run
+        (`exe`, defaulting to Prover9) is mixed in so upgrading that binary
+        invalidates its old entries. `extra` distinguishes otherwise-
+        identical problems run through different tools/options (e.g. Mace4
+        with a specific domain size).
+        """
+        if exe is None:
+            exe = self.prover_exe
+        normalized = sorted(re.sub(r"\s+", " ", p).strip() for p in premises)
+        normalized.append(re.sub(r"\s+", " ", conclusion).strip())
+        if extra:
+            normalized.append(extra)
+        try:
+            st = exe.stat()
+            normalized.append(f"{exe}:{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            normalized.append(str(exe))
+        data = _CACHE_KEY_SEP.join(normalized).encode("utf-8")
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached proof result in memory, then on disk"""
+        if not self.cache_enabled:
+            return None
+
+        if key in self._proof_cache:
+            self._proof_cache.move_to_end(key)
+            return self._proof_cache[key]
+
+        if self.cache_dir is not None:
+            cache_file = self.cache_dir / f"{key}.json"
+            try:
+                with open(cache_file, "r", encoding="utf-8") as f:
+                    result = json.load(f)
+                self._cache_put_memory(key, result)
+                return result
+            except (FileNotFoundError, json.JSONDecodeError, OSError):
+                pass  # Not cached on disk or unreadable
+
+        return None
+
+    def _cache_put_memory(self, key: str, result: Dict[str, Any]):
+        """Store a result in the in-memory LRU cache, evicting oldest entries"""
+        self._proof_cache[key] = result
+        self._proof_cache.move_to_end(key)
+        while len(self._proof_cache) > PROOF_CACHE_MAX_ENTRIES:
+            self._proof_cache.popitem(last=False)
+
+    def _cache_put(self, key: str, result: Dict[str, Any]):
+        """Store a definitive proof result in memory and on disk"""
+        if not self.cache_enabled:
+            return
+
+        self._cache_put_memory(key, result)
+        if self.cache_dir is not None:
+            cache_file = self.cache_dir / f"{key}.json"
+            try:
+                with open(cache_file, "w", encoding="utf-8") as f:
+                    json.dump(result, f)
+            except OSError as e:
+                logger.debug("Failed to write proof cache file %s: %s", cache_file, e)
 
-        input_content = "\n".join(content)
-        logger.debug(f"Created input file content:\n{input_content}")
+    def _stash_output(self, result: Dict[str, Any], include_output: bool) -> Dict[str, Any]:
+        """Move complete_output out of the response into the output store.
 
-        fd, path = tempfile.mkstemp(suffix=".in", text=True)
-        with os.fdopen(fd, "w") as f:
-            f.write(input_content)
-        return Path(path)
+        Responses carry an output_path the client can fetch with the
+        get-prover-output tool; the inline text is kept only when the
+        caller explicitly asked for it.
+        """
+        output = result.get("complete_output")
+        if output is None or self.output_dir is None:
+            return result
 
-    def _run_prover(self, input_path: Path, timeout: int = 60) -> Dict[str, Any]:
-        """Run Prover9 directly"""
+        result = dict(result)
+        output = result.pop("complete_output")
+        output_file = self.output_dir / f"{uuid.uuid4().hex}.txt"
+        try:
+            output_file.write_text(output, encoding="utf-8")
+            result["output_path"] = str(output_file)
+        except OSError as e:
+            logger.debug("Failed to store prover output %s: %s", output_file, e)
+            result["complete_output"] = output
+            return result
+
+        if include_output:
+            result["complete_output"] = output
+        return result
+
+    def _inline_output(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Re-attach the stored output text to a result that references it"""
+        if "complete_output" in result or "output_path" not in result:
+            return result
         try:
-            logger.debug(f"Running Prover9 with input file: {input_path}")
+            return {**result, "complete_output": Path(result["output_path"]).read_text(encoding="utf-8")}
+        except OSError:
+            return result
+
+    async def prove(self, premises: List[str], conclusion: str, include_output: bool = False) -> Dict[str, Any]:
+        """Prove a conclusion from premises, consulting the proof cache first.
+
+        Only definitive outcomes (proved/unprovable) are cached; errors and
+        timeouts are always retried. The full prover output is stored on
+        disk and referenced by output_path unless include_output is set.
+        """
+        key = self._cache_key(premises, conclusion)
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.debug("Proof cache hit for key %s", key)
+            return self._inline_output(cached) if include_output else cached
+
+        input_text = self._build_input(premises, conclusion)
+        result = self._stash_output(await self._run_prover(input_text), include_output)
+        if result.get("result") in ("proved", "unprovable"):
+            self._cache_put(key, {k: v for k, v in result.items() if k != "complete_output"})
+        return result
+
+    async def prove_batch(self, premises: List[str], conclusions: List[str]) -> List[Dict[str, Any]]:
+        """Prove several conclusions against one premise set concurrently.
+
+        Each goal runs as its own prover process (Prover9 is one-shot), but
+        they execute in parallel up to the worker-slot cap, so wall time for
+        a batch approaches the slowest goal rather than the sum.
+        """
+        return list(await asyncio.gather(*(self.prove(premises, conclusion) for conclusion in conclusions)))
+
+    def _build_input(self, premises: List[str], goal: str) -> str:
+        """Build Prover9 input text for the given premises and goal"""
+        buf = ["formulas(assumptions).\n"]
+        for p in premises:
+            buf.append(p)
+            buf.append("\n" if p.endswith(".") else ".\n")
+        buf.append("end_of_list.\n\nformulas(goals).\n")
+        buf.append(goal)
+        buf.append("\n" if goal.endswith(".") else ".\n")
+        buf.append("end_of_list.")
+
+        input_content = "".join(buf)
+        logger.debug("Built prover input:\n%s", input_content)
+        return input_content
+
+    @staticmethod
+    async def _terminate_prover(proc: asyncio.subprocess.Process, grace: float = 0.5):
+        """Terminate a prover subprocess, escalating to kill after a grace period"""
+        if proc.returncode is not None:
+            return
+        proc.terminate()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=grace)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+
+    async def _consume_prover_output(self, proc: asyncio.subprocess.Process) -> Dict[str, Any]:
+        """Stream Prover9 stdout line-by-line and decide the outcome early.
+
+        Prover9 emits THEOREM PROVED and the PROOF block well before its
+        statistics epilogue; once the proof is fully captured (or SEARCH
+        FAILED appears) the process is terminated instead of waiting for
+        the remaining output.
+        """
+        lines: List[str] = []
+        seen_proved = False
+        in_proof_block = False
+        proof_done = False
+        proof_lines: List[str] = []
+
+        async for raw in proc.stdout:
+            line = raw.decode()
+            lines.append(line)
+
+            if "THEOREM PROVED" in line:
+                seen_proved = True
+            elif "SEARCH FAILED" in line:
+                await self._terminate_prover(proc)
+                return {"result": "unprovable", "reason": "Proof search failed", "complete_output": "".join(lines)}
+
+            if in_proof_block:
+                if "end of proof" in line:
+                    in_proof_block = False
+                    proof_done = True
+                else:
+                    proof_lines.append(line)
+            elif "PROOF =" in line:
+                in_proof_block = True
+
+            if seen_proved and proof_done:
+                await self._terminate_prover(proc)
+                return {"result": "proved", "proof": "".join(proof_lines).strip(), "complete_output": "".join(lines)}
+
+        await proc.wait()
+        stdout = "".join(lines)
+        if seen_proved and proof_lines:
+            # Proof block without a recognized terminator; use what we have
+            return {"result": "proved", "proof": "".join(proof_lines).strip(), "complete_output": stdout}
+        return {"result": "undecided", "output": stdout}
+
+    async def _run_prover(self, input_text: str, timeout: int = 60) -> Dict[str, Any]:
+        """Run Prover9 without blocking the event loop.
+
+        The input is fed through the prover's stdin (Prover9 reads stdin
+        when no -f flag is given), so no temp file ever touches disk.
+        """
+        try:
+            logger.debug("Running Prover9 via stdin")
 
             # Set working directory to Prover9 directory
             cwd = str(self.prover_exe.parent)
-            result = subprocess.run([str(self.prover_exe), "-f", str(input_path)], capture_output=True, text=True, timeout=timeout, cwd=cwd)
-
-            logger.debug(f"Prover9 stdout:\n{result.stdout}")
-            if result.stderr:
-                logger.debug(f"Prover9 stderr:\n{result.stderr}")
-
-            if "THEOREM PROVED" in result.stdout:
-                proof = result.stdout.split("PROOF =")[1].split("====")[0].strip()
-                return {"result": "proved", "proof": proof, "complete_output": result.stdout}
-            elif "SEARCH FAILED" in result.stdout:
-                return {"result": "unprovable", "reason": "Proof search failed", "complete_output": result.stdout}
-            elif "Fatal error" in result.stderr:
-                return {"result": "error", "reason": "Syntax error", "error": result.stderr}
+            async with self._worker_slots:
+                proc = await asyncio.create_subprocess_exec(
+                    str(self.prover_exe),
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd)
+                proc.stdin.write(input_text.encode())
+                await proc.stdin.drain()
+                proc.stdin.close()
+                stderr_task = asyncio.create_task(proc.stderr.read())
+                try:
+                    result = await asyncio.wait_for(self._consume_prover_output(proc), timeout=timeout)
+                except asyncio.TimeoutError:
+                    stderr_task.cancel()
+                    proc.kill()
+                    await proc.wait()
+                    logger.error("Proof search timed out after %s seconds", timeout)
+                    return {"result": "timeout", "reason": f"Proof search exceeded {timeout} seconds"}
+                stderr = (await stderr_task).decode()
+
+            if stderr:
+                logger.debug("Prover9 stderr:\n%s", stderr)
+
+            if result["result"] != "undecided":
+                return result
+            elif "Fatal error" in stderr:
+                return {"result": "error", "reason": "Syntax error", "error": stderr}
             else:
-                return {"result": "error", "reason": "Unexpected output", "output": result.stdout, "error": result.stderr}
-        except subprocess.TimeoutExpired:
-            logger.error(f"Proof search timed out after {timeout} seconds")
-            return {"result": "timeout", "reason": f"Proof search exceeded {timeout} seconds"}
+                return {"result": "error", "reason": "Unexpected output", "output": result["output"], "error": stderr}
         except Exception as e:
-            logger.error(f"Prover error: {e}")
+            logger.error("Prover error: %s", e)
             return {"result": "error", "reason": str(e)}
-        finally:
-            try:
-                input_path.unlink()  # Clean up temp file
-            except (FileNotFoundError, PermissionError, OSError):
-                pass  # Temp file cleanup failed, not critical
 
-    def _extract_formulas_from_input(self, arguments: dict) -> Tuple[List[str], Optional[str]]:
+    def _load_input(self, arguments: dict) -> Tuple[List[str], Optional[str], bool]:
         """
-        Extract formulas from either JSON input or file input.
+        Load premises and conclusion from either JSON input or file input.
+
+        The schema's oneOf guarantees the two modes are mutually exclusive,
+        so every tool branch dispatches once on input_file here and shares
+        the same (cached) file-parse path.
 
         Args:
             arguments: Tool arguments
 
         Returns:
-            Tuple of (premises, conclusion)
+            Tuple of (premises, conclusion, from_file)
         """
         if "input_file" in arguments:
             # File input mode
             file_path = arguments["input_file"]
             try:
                 premises, conclusion = parse_prover9_file(file_path)
-                return premises, conclusion
             except Exception as e:
                 raise ValueError(f"Failed to parse input file {file_path}: {e}")
-        else:
-            # JSON input mode (backward compatibility)
-            premises = arguments.get("premises", [])
-            conclusion = arguments.get("conclusion")
-            return premises, conclusion
-
-    def _extract_premises_from_input(self, arguments: dict) -> List[str]:
-        """
-        Extract premises from either JSON input or file input.
+            return premises, conclusion, True
 
-        Args:
-            arguments: Tool arguments
-
-        Returns:
-            List of premises
-        """
-        if "input_file" in arguments:
-            # File input mode
-            file_path = arguments["input_file"]
-            try:
-                return parse_mace4_file(file_path)
-            except Exception as e:
-                raise ValueError(f"Failed to parse input file {file_path}: {e}")
-        else:
-            # JSON input mode (backward compatibility)
-            return arguments.get("premises", [])
+        # JSON input mode (backward compatibility)
+        return arguments.get("premises", []), arguments.get("conclusion"), False
 
 
-async def main(prover_path: str):
-    logger.info(f"Starting Logic MCP Server with Prover9/Mace4 at: {prover_path}")
+async def main(prover_path: str, cache_dir: Optional[Path] = DEFAULT_CACHE_DIR, max_workers: int = DEFAULT_PROVER_WORKERS):
+    logger.info("Starting Logic MCP Server with Prover9/Mace4 at: %s", prover_path)
 
-    engine = LogicEngine(prover_path)
+    engine = LogicEngine(prover_path, cache_dir=cache_dir, max_workers=max_workers)
     server = Server("logic-manager")
 
     @server.list_tools()
@@ -169,19 +461,42 @@ async def main(prover_path: str):
                         {
                             "properties": {
                                 "premises": {"type": "array", "items": {"type": "string"}, "description": "List of logical premises"},
-                                "conclusion": {"type": "string", "description": "Statement to prove"}
+                                "conclusion": {"type": "string", "description": "Statement to prove"},
+                                "include_output": {"type": "boolean", "default": False, "description": "Include the full Prover9 output inline (it is always available via output_path)"}
                             },
                             "required": ["premises", "conclusion"]
                         },
                         {
                             "properties": {
-                                "input_file": {"type": "string", "description": "Path to a Prover9 .in file containing formulas(assumptions) and formulas(goals)"}
+                                "input_file": {"type": "string", "description": "Path to a Prover9 .in file containing formulas(assumptions) and formulas(goals)"},
+                                "include_output": {"type": "boolean", "default": False, "description": "Include the full Prover9 output inline (it is always available via output_path)"}
                             },
                             "required": ["input_file"]
                         }
                     ]
                 },
             ),
+            types.Tool(
+                name="get-prover-output",
+                description="Fetch the full Prover9 output referenced by an output_path from a previous prove result",
+                inputSchema={
+                    "type": "object",
+                    "properties": {"output_path": {"type": "string", "description": "output_path value from a prove response"}},
+                    "required": ["output_path"],
+                },
+            ),
+            types.Tool(
+                name="prove-batch",
+                description="Prove several conclusions against one shared set of premises. Goals run concurrently, so batches finish in roughly the time of the slowest goal.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "premises": {"type": "array", "items": {"type": "string"}, "description": "List of logical premises shared by every goal"},
+                        "conclusions": {"type": "array", "items": {"type": "string"}, "description": "Statements to prove"}
+                    },
+                    "required": ["premises", "conclusions"]
+                },
+            ),
             types.Tool(
                 name="check-well-formed",
                 description="Check if logical statements are well-formed with detailed syntax validation. Supports both JSON input and .in files.",
@@ -283,109 +598,138 @@ async def main(prover_path: str):
         try:
             if name == "prove":
                 # Extract formulas from input (JSON or file)
-                premises, conclusion = engine._extract_formulas_from_input(arguments)
+                premises, conclusion, _ = engine._load_input(arguments)
 
                 if conclusion is None:
-                    return [types.TextContent(type="text", text=json.dumps({"result": "error", "reason": "No conclusion found in input. For file input, ensure formulas(goals) section exists."}, indent=2))]
+                    return [types.TextContent(type="text", text=_dumps({"result": "error", "reason": "No conclusion found in input. For file input, ensure formulas(goals) section exists."}))]
 
                 # Validate syntax first
                 all_formulas = premises + [conclusion]
                 validation = validate_formulas(all_formulas)
 
                 if not validation["valid"]:
-                    return [types.TextContent(type="text", text=json.dumps({"result": "syntax_error", "validation": validation}, indent=2))]
+                    return [types.TextContent(type="text", text=_dumps({"result": "syntax_error", "validation": validation}))]
+
+                # Run proof (cached for repeated premises/conclusion)
+                results = await engine.prove(premises, conclusion, include_output=arguments.get("include_output", False))
+                return [types.TextContent(type="text", text=_dumps(results))]
 
-                # Run proof
-                input_file = engine._create_input_file(premises, conclusion)
-                results = engine._run_prover(input_file)
-                return [types.TextContent(type="text", text=json.dumps(results, indent=2))]
+            elif name == "get-prover-output":
+                output_path = Path(arguments["output_path"]).resolve()
+                if engine.output_dir is None or not output_path.is_relative_to(engine.output_dir.resolve()):
+                    return [types.TextContent(type="text", text=_dumps({"result": "error", "reason": "output_path does not reference a stored prover output"}))]
+                try:
+                    output = output_path.read_text(encoding="utf-8")
+                except OSError as e:
+                    return [types.TextContent(type="text", text=_dumps({"result": "error", "reason": f"Failed to read prover output: {e}"}))]
+                return [types.TextContent(type="text", text=_dumps({"output": output}))]
+
+            elif name == "prove-batch":
+                premises = arguments.get("premises", [])
+                conclusions = arguments.get("conclusions", [])
+
+                if not conclusions:
+                    return [types.TextContent(type="text", text=_dumps({"result": "error", "reason": "No conclusions provided"}))]
+
+                # Validate syntax first
+                validation = validate_formulas(premises + conclusions)
+                if not validation["valid"]:
+                    return [types.TextContent(type="text", text=_dumps({"result": "syntax_error", "validation": validation}))]
+
+                results = await engine.prove_batch(premises, conclusions)
+                batch = [{"conclusion": conclusion, **result} for conclusion, result in zip(conclusions, results)]
+                return [types.TextContent(type="text", text=_dumps({"results": batch}))]
 
             elif name == "check-well-formed":
                 if "input_file" in arguments:
-                    # File input mode
+                    # File input mode: whole response cached until the file changes
                     try:
-                        premises, conclusion = parse_prover9_file(arguments["input_file"])
-                        statements = premises + ([conclusion] if conclusion else [])
+                        path = Path(arguments["input_file"]).resolve()
+                        st = path.stat()
+                        payload = _validate_file(str(path), st.st_mtime_ns, st.st_size)
                     except Exception as e:
-                        return [types.TextContent(type="text", text=json.dumps({"result": "error", "reason": f"Failed to parse input file: {e}"}, indent=2))]
-                else:
-                    # JSON input mode (backward compatibility)
-                    statements = arguments["statements"]
+                        return [types.TextContent(type="text", text=_dumps({"result": "error", "reason": f"Failed to parse input file: {e}"}))]
+                    return [types.TextContent(type="text", text=payload)]
 
+                # JSON input mode (backward compatibility)
+                statements = arguments["statements"]
                 validation = validate_formulas(statements)
-                return [types.TextContent(type="text", text=json.dumps(validation, indent=2))]
+                return [types.TextContent(type="text", text=_dumps(validation))]
 
             elif name == "find-model":
                 if not engine.mace4:
-                    return [types.TextContent(type="text", text=json.dumps({"error": "Mace4 not available"}))]
+                    return [types.TextContent(type="text", text=_dumps({"error": "Mace4 not available"}))]
 
                 # Extract premises from input (JSON or file)
-                premises = engine._extract_premises_from_input(arguments)
+                premises, _, _ = engine._load_input(arguments)
                 domain_size = arguments.get("domain_size")
 
-                result = engine.mace4.find_model(premises, domain_size)
-                return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+                key = engine._cache_key(premises, "", extra=f"mace4:find_model:{domain_size}", exe=engine.mace4.mace4_exe)
+                result = engine._cache_get(key)
+                if result is None:
+                    result = engine.mace4.find_model(premises, domain_size)
+                    if result.get("result") in ("model_found", "no_model_found"):
+                        engine._cache_put(key, result)
+                return [types.TextContent(type="text", text=_dumps(result))]
 
             elif name == "find-counterexample":
                 if not engine.mace4:
-                    return [types.TextContent(type="text", text=json.dumps({"error": "Mace4 not available"}))]
+                    return [types.TextContent(type="text", text=_dumps({"error": "Mace4 not available"}))]
 
                 # Extract formulas from input (JSON or file)
-                premises, conclusion = engine._extract_formulas_from_input(arguments)
+                premises, conclusion, _ = engine._load_input(arguments)
 
                 if conclusion is None:
-                    return [types.TextContent(type="text", text=json.dumps({"result": "error", "reason": "No conclusion found in input. For file input, ensure formulas(goals) section exists."}, indent=2))]
+                    return [types.TextContent(type="text", text=_dumps({"result": "error", "reason": "No conclusion found in input. For file input, ensure formulas(goals) section exists."}))]
 
                 domain_size = arguments.get("domain_size")
-                result = engine.mace4.find_counterexample(premises, conclusion, domain_size)
-                return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+                key = engine._cache_key(premises, conclusion, extra=f"mace4:find_counterexample:{domain_size}", exe=engine.mace4.mace4_exe)
+                result = engine._cache_get(key)
+                if result is None:
+                    result = engine.mace4.find_counterexample(premises, conclusion, domain_size)
+                    if result.get("result") in ("model_found", "no_model_found"):
+                        engine._cache_put(key, result)
+                return [types.TextContent(type="text", text=_dumps(result))]
 
             elif name == "verify-commutativity":
-                helpers = CategoricalHelpers()
-                premises, conclusion = helpers.verify_commutativity(arguments["path_a"], arguments["path_b"], arguments["object_start"], arguments["object_end"])
+                premises, conclusion = _HELPERS.verify_commutativity(arguments["path_a"], arguments["path_b"], arguments["object_start"], arguments["object_end"])
 
                 # Add category axioms if requested
                 if arguments.get("with_category_axioms", True):
-                    cat_axioms = helpers.category_axioms()
-                    premises = cat_axioms + premises
+                    premises = _CATEGORY_AXIOMS + premises
 
                 result = {"premises": premises, "conclusion": conclusion, "note": "Use the 'prove' tool with these premises and conclusion to verify commutativity"}
-                return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+                return [types.TextContent(type="text", text=_dumps(result))]
 
             elif name == "get-category-axioms":
-                helpers = CategoricalHelpers()
                 concept = arguments["concept"]
 
                 if concept == "category":
-                    axioms = helpers.category_axioms()
+                    axioms = _CATEGORY_AXIOMS
                 elif concept == "functor":
                     functor_name = arguments.get("functor_name", "F")
-                    axioms = helpers.functor_axioms(functor_name)
+                    axioms = list(_functor_axioms(functor_name))
                 elif concept == "natural-transformation":
                     functor_f = arguments.get("functor_f", "F")
                     functor_g = arguments.get("functor_g", "G")
                     component = arguments.get("component", "alpha")
-                    axioms = helpers.natural_transformation_condition(functor_f, functor_g, component)
+                    axioms = list(_natural_transformation_condition(functor_f, functor_g, component))
                 elif concept == "monoid":
-                    from mcp_logic.categorical_helpers import monoid_axioms
-
-                    axioms = monoid_axioms()
+                    axioms = _MONOID_AXIOMS
                 elif concept == "group":
-                    from mcp_logic.categorical_helpers import group_axioms
-
-                    axioms = group_axioms()
+                    axioms = _GROUP_AXIOMS
                 else:
                     axioms = []
 
                 result = {"concept": concept, "axioms": axioms}
-                return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+                return [types.TextContent(type="text", text=_dumps(result))]
 
             else:
                 raise ValueError(f"Unknown tool: {name}")
 
         except Exception as e:
-            logger.error(f"Tool error: {e}", exc_info=True)
-            return [types.TextContent(type="text", text=json.dumps({"error": str(e), "type": type(e).__name__}))]
+            logger.error("Tool error: %s", e, exc_info=True)
+            return [types.TextContent(type="text", text=_dumps({"error": str(e), "type": type(e).__name__}))]
 
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         logger.info("Server running with stdio transport")
@@ -406,8 +750,14 @@ async def main(prover_path: str):
 def cli():
     parser = argparse.ArgumentParser(description="MCP Logic Server")
     parser.add_argument("--prover-path", type=str, required=True, help="Path to Prover9/Mace4 binaries")
+    parser.add_argument("--cache-dir", type=str, default=str(DEFAULT_CACHE_DIR), help="Directory for the on-disk proof cache")
+    parser.add_argument("--no-cache", action="store_true", help="Disable proof result caching")
+    parser.add_argument("--prover-workers", type=int, default=DEFAULT_PROVER_WORKERS, help="Maximum number of concurrent Prover9 subprocesses")
+    parser.add_argument("--log-level", type=str, default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="Logging level")
     args = parser.parse_args()
-    asyncio.run(main(args.prover_path))
+    logging.basicConfig(level=getattr(logging, args.log_level))
+    cache_dir = None if args.no_cache else Path(args.cache_dir)
+    asyncio.run(main(args.prover_path, cache_dir=cache_dir, max_workers=args.prover_workers))
 
 
 if __name__ == "__main__":
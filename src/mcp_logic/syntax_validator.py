@@ -5,6 +5,7 @@ Provides early feedback on common syntax errors to improve user experience.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Tuple
 
 
@@ -139,6 +140,18 @@ class SyntaxValidator:
             self.errors.append("Empty parentheses found - predicates and functions must have arguments")
 
 
+@lru_cache(maxsize=4096)
+def _validate_one(formula: str) -> Tuple[bool, Tuple[str, ...], Tuple[str, ...]]:
+    """Validate a single formula, memoized on the exact formula string.
+
+    Validation is pure string analysis, so repeated formulas (the common
+    case when the same premise set is checked and then proved) become a
+    cache lookup. Returns immutable tuples so cached results are shareable.
+    """
+    is_valid, errors, warnings = SyntaxValidator().validate(formula)
+    return is_valid, tuple(errors), tuple(warnings)
+
+
 def validate_formulas(formulas: List[str]) -> Dict[str, any]:
     """Validate a list of formulas
 
@@ -148,13 +161,12 @@ def validate_formulas(formulas: List[str]) -> Dict[str, any]:
     Returns:
         Dictionary with validation results
     """
-    validator = SyntaxValidator()
     results = {"valid": True, "formula_results": []}
 
-    for i, formula in enumerate(formulas):
-        is_valid, errors, warnings = validator.validate(formula)
+    for formula in formulas:
+        is_valid, errors, warnings = _validate_one(formula)
 
-        formula_result = {"formula": formula, "valid": is_valid, "errors": errors, "warnings": warnings}
+        formula_result = {"formula": formula, "valid": is_valid, "errors": list(errors), "warnings": list(warnings)}
 
         results["formula_results"].append(formula_result)
 
@@ -3,16 +3,45 @@
 Test script for MCP-Logic file input functionality
 """
 import json
+import os
+import selectors
 import subprocess
 import time
-import signal
-import os
+
+READ_TIMEOUT = 10.0
+
+def read_response(process, sel, buffer, want_id, timeout=READ_TIMEOUT):
+    """Read JSON-RPC lines from the server until the reply with want_id arrives"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if not sel.select(timeout=deadline - time.monotonic()):
+            break
+        chunk = os.read(process.stdout.fileno(), 65536)
+        if not chunk:
+            break
+        buffer += chunk
+        while b"\n" in buffer:
+            line = bytes(buffer).partition(b"\n")[0]
+            del buffer[:len(line) + 1]
+            if not line.strip():
+                continue
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if message.get("id") == want_id:
+                return message
+    return None
+
+def send(process, message):
+    process.stdin.write((json.dumps(message) + "\n").encode())
+    process.stdin.flush()
 
 def test_file_input():
     # MCP request for the prove tool using file input
     request = {
         "jsonrpc": "2.0",
-        "id": 1,
+        "id": 2,
         "method": "tools/call",
         "params": {
             "name": "prove",
@@ -22,9 +51,6 @@ def test_file_input():
         }
     }
 
-    # Convert to JSON
-    request_json = json.dumps(request) + "\n"
-
     # Start the MCP server process
     server_cmd = [
         "uv", "run", "--directory", "src/mcp_logic", "mcp_logic",
@@ -32,40 +58,52 @@ def test_file_input():
     ]
 
     try:
-        # Start the server
+        # Start the server (binary pipes; we frame and flush explicitly)
         process = subprocess.Popen(
             server_cmd,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
             cwd="/Volumes/External/Code/mcp-logic"
         )
 
-        # Give server time to start
-        time.sleep(2)
+        sel = selectors.DefaultSelector()
+        sel.register(process.stdout, selectors.EVENT_READ)
+        buffer = bytearray()
+
+        # Readiness handshake: wait for the initialize reply instead of sleeping
+        send(process, {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2024-11-05",
+                "capabilities": {},
+                "clientInfo": {"name": "test_file_input", "version": "0.1"}
+            }
+        })
+        init_response = read_response(process, sel, buffer, want_id=1)
+        if init_response is None:
+            print("❌ Server did not answer initialize request")
+            return
+        send(process, {"jsonrpc": "2.0", "method": "notifications/initialized"})
 
-        # Send the request
-        process.stdin.write(request_json)
-        process.stdin.flush()
+        # Send the prove request
+        send(process, request)
+        response = read_response(process, sel, buffer, want_id=2)
 
-        # Read response
-        response = process.stdout.readline()
-        if response:
+        if response is not None:
             print("Response from MCP-Logic prove tool (file input):")
-            try:
-                parsed = json.loads(response)
-                if "result" in parsed and parsed["result"] == "proved":
-                    print("✅ SUCCESS: Theorem proved using file input!")
-                    print("The syllogism 'All men are mortal, Socrates is a man, therefore Socrates is mortal' was successfully proved.")
-                else:
-                    print("❌ Result:", json.dumps(parsed, indent=2))
-            except json.JSONDecodeError:
-                print("Raw response:", response)
+            if "result" in response and "proved" in json.dumps(response["result"]):
+                print("✅ SUCCESS: Theorem proved using file input!")
+                print("The syllogism 'All men are mortal, Socrates is a man, therefore Socrates is mortal' was successfully proved.")
+            else:
+                print("❌ Result:", json.dumps(response, indent=2))
         else:
             print("No response received")
 
         # Clean up
+        sel.unregister(process.stdout)
         process.terminate()
         try:
             process.wait(timeout=5)
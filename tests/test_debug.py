@@ -1,10 +1,8 @@
 from mcp_logic.server import LogicEngine
-import tempfile
-import os
+import asyncio
 
 def test_direct_prover9():
-    """Test direct Prover9 execution with exact file contents"""
-    # Create test file
+    """Test direct Prover9 execution with exact input contents"""
     content = """formulas(assumptions).
 all x (man(x) -> mortal(x)).
 man(socrates).
@@ -14,13 +12,9 @@ formulas(goals).
 mortal(socrates).
 end_of_list.
 """
-    
-    fd, path = tempfile.mkstemp(suffix='.in', text=True)
-    with os.fdopen(fd, 'w') as f:
-        f.write(content)
-        
+
     engine = LogicEngine("F:/Prover9-Mace4/bin-win32")
-    result = engine._run_prover(path)
+    result = asyncio.run(engine._run_prover(content))
     print("\nProver Result:", result)
-    
-    assert result["result"] == "proved"
\ No newline at end of file
+
+    assert result["result"] == "proved"
@@ -0,0 +1,87 @@
+from mcp_logic.file_parser import Prover9FileParser
+
+def test_parse_basic_sections():
+    """Test the standard layout with one formula per line"""
+    content = """formulas(assumptions).
+all x (man(x) -> mortal(x)).
+man(socrates).
+end_of_list.
+
+formulas(goals).
+mortal(socrates).
+end_of_list.
+"""
+    premises, conclusion = Prover9FileParser().parse_content(content)
+    assert premises == ["all x (man(x) -> mortal(x))", "man(socrates)"]
+    assert conclusion == "mortal(socrates)"
+
+def test_parse_content_after_section_header():
+    """Formulas on the same line as the section header must be kept"""
+    content = """formulas(assumptions). p(a).
+end_of_list.
+formulas(goals). q(b).
+end_of_list.
+"""
+    premises, conclusion = Prover9FileParser().parse_content(content)
+    assert premises == ["p(a)"]
+    assert conclusion == "q(b)"
+
+def test_parse_inline_end_of_list_closes_section():
+    """An end_of_list after a formula must stop the section there"""
+    content = """formulas(assumptions).
+p(a). end_of_list.
+assign(max_seconds, 30).
+formulas(goals).
+q(b).
+end_of_list.
+"""
+    premises, conclusion = Prover9FileParser().parse_content(content)
+    assert premises == ["p(a)"]
+    assert conclusion == "q(b)"
+
+def test_parse_comments_and_blank_lines_skipped():
+    """Comment lines and blank lines are ignored"""
+    content = """% header comment
+formulas(assumptions).
+% explains the premise
+p(a).
+
+end_of_list.
+"""
+    premises, conclusion = Prover9FileParser().parse_content(content)
+    assert premises == ["p(a)"]
+    assert conclusion is None
+
+def test_parse_multiline_and_multi_formula_lines():
+    """Formulas split across lines and several formulas on one line"""
+    content = """formulas(assumptions).
+p(a). q(b).
+all x (p(x) ->
+  q(x)).
+end_of_list.
+"""
+    premises, conclusion = Prover9FileParser().parse_content(content)
+    assert premises == ["p(a)", "q(b)", "all x (p(x) -> q(x))"]
+    assert conclusion is None
+
+def test_parse_first_goal_is_conclusion():
+    """Only the first goal becomes the conclusion"""
+    content = """formulas(goals).
+q(a). r(b).
+end_of_list.
+"""
+    premises, conclusion = Prover9FileParser().parse_content(content)
+    assert premises == []
+    assert conclusion == "q(a)"
+
+def test_parse_content_outside_sections_ignored():
+    """Directives outside any formulas(...) section are not premises"""
+    content = """assign(max_seconds, 30).
+formulas(assumptions).
+p(a).
+end_of_list.
+assign(domain_size, 2).
+"""
+    premises, conclusion = Prover9FileParser().parse_content(content)
+    assert premises == ["p(a)"]
+    assert conclusion is None
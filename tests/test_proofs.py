@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from pathlib import Path
 from mcp_logic.server import LogicEngine
@@ -6,12 +7,12 @@ def test_socrates_mortality():
     """Test basic syllogistic reasoning"""
     engine = LogicEngine("F:/Prover9-Mace4/bin-win32")
     
-    input_file = engine._create_input_file(
+    input_text = engine._build_input(
         premises=["all x (man(x) -> mortal(x))", "man(socrates)"],
         goal="mortal(socrates)"
     )
     
-    result = engine._run_prover(input_file)
+    result = asyncio.run(engine._run_prover(input_text))
     assert result["result"] == "proved"
 
 def test_complex_proof():
@@ -26,23 +27,23 @@ def test_complex_proof():
         "admires(plato,aristotle)"
     ]
     
-    input_file = engine._create_input_file(
+    input_text = engine._build_input(
         premises=premises,
         goal="seeks_wisdom(plato,aristotle)"
     )
     
-    result = engine._run_prover(input_file)
+    result = asyncio.run(engine._run_prover(input_text))
     assert result["result"] == "proved"
 
 def test_syntax_validation():
     """Test syntax validation on invalid input"""
     engine = LogicEngine("F:/Prover9-Mace4/bin-win32")
     
-    input_file = engine._create_input_file(
+    input_text = engine._build_input(
         premises=["invalid syntax here"],
         goal="this_is_not_valid"
     )
     
-    result = engine._run_prover(input_file)
+    result = asyncio.run(engine._run_prover(input_text))
     assert result["result"] == "error"
     assert "error" in result
\ No newline at end of file